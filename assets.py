@@ -1,6 +1,25 @@
+import io
 import pygame
 import config
 
+
+def convert_overlay(surface):
+    """
+    Converts a per-pixel-alpha surface to the display's alpha pixel format so
+    blitting it skips per-pixel format conversion. Without a display (e.g. on
+    the Pi framebuffer) the surface is returned unchanged.
+
+    Args:
+        surface: A pygame.Surface created with pygame.SRCALPHA.
+
+    Returns:
+        The converted surface, or the original one.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
 class AssetManager:
     """
     A centralized manager for loading, storing, and retrieving game assets.
@@ -10,6 +29,8 @@ class AssetManager:
         """Initializes the AssetManager and pre-loads all assets."""
         self.fonts = {}
         self.images = {}
+        self.text_cache = {}  # (font_name, text, color, antialias) -> rendered Surface
+        self._font_data = {}  # file path -> raw font bytes, read from disk once
         self.load_assets()
 
     def load_assets(self):
@@ -24,26 +45,48 @@ class AssetManager:
         self.load_image("asteroid", config.ImagePaths.ASTEROID)
         self.load_image("background", config.ImagePaths.BACKGROUND)
 
+        # Direct attributes for hot paths; get_font/get_image remain for dynamic access
+        self.font_regular = self.fonts["regular"]
+        self.font_subtext = self.fonts["subtext"]
+        self.font_title = self.fonts["title"]
+        self.image_crosshair = self.images["crosshair"]
+        self.image_asteroid = self.images["asteroid"]
+        self.image_background = self.images["background"]
+
     def load_font(self, name, path, size):
         """
-        Loads a font from a file and stores it in the manager.
+        Loads a font from a file and stores it in the manager. The file is
+        read only once; every font using it is built from the same in-memory bytes.
 
         Args:
             name: The key to store the font under.
             path: The file path to the font.
             size: The size to load the font in.
         """
-        self.fonts[name] = pygame.font.Font(path, size)
+        data = self._font_data.get(path)
+        if data is None:
+            with open(path, "rb") as font_file:
+                data = font_file.read()
+            self._font_data[path] = data
+        self.fonts[name] = pygame.font.Font(io.BytesIO(data), size)
 
     def load_image(self, name, path):
         """
         Loads an image from a file and stores it in the manager.
+        If a display mode is set, the image is converted to the display's
+        pixel format once here so later blits skip per-pixel conversion.
 
         Args:
             name: The key to store the image under.
             path: The file path to the image.
         """
-        self.images[name] = pygame.image.load(path)
+        image = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        self.images[name] = image
 
     def get_font(self, name):
         """
@@ -68,3 +111,27 @@ class AssetManager:
             A pygame.Surface object.
         """
         return self.images.get(name)
+
+    def get_text(self, font_name, text, color, antialias=True):
+        """
+        Retrieves a rendered text surface, rasterizing it (and converting it
+        with convert_overlay) only on first use.
+
+        Args:
+            font_name: The key of the pre-loaded font to render with.
+            text: The string to render.
+            color: The RGB color tuple of the text.
+            antialias: Whether the text should be antialiased.
+
+        Returns:
+            A pygame.Surface object containing the rendered text.
+        """
+        key = (font_name, text, color, antialias)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Keep the cache bounded; ever-changing strings (e.g. counters) would otherwise grow it forever
+            if len(self.text_cache) >= config.TEXT_CACHE_SIZE:
+                self.text_cache.clear()
+            surface = convert_overlay(self.fonts[font_name].render(text, antialias, color))
+            self.text_cache[key] = surface
+        return surface
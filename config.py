@@ -11,6 +11,14 @@ from events import Events
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 COLOR_DEPTH = 16
+FRAMEBUFFER_PATH = "/dev/fb0" # Raspberry Pi output device
+DIRTY_RECT_LIMIT = 25 # Desktop: above this many changed rects a full flip is used instead of a rect update
+
+# Debugging
+# -----------------------------------------------------------------------------
+DEBUG = False # Enables per-event/per-attempt console logging
+BOARD_ATTEMPT_LOG_INTERVAL = 1000 # Without DEBUG, log only every Nth board generation attempt
+# -----------------------------------------------------------------------------
 
 # Game Settings
 # -----------------------------------------------------------------------------
@@ -24,6 +32,10 @@ GAME_TITLE = "ASTEROIDSCANNER"
 # -----------------------------------------------------------------------------
 GAME_OVER_RESET_DELAY = 3000 # ms
 FAIL_VIEW_TIMER_LENGTH = 60 # seconds
+BUTTON_BOUNCE_TIME = 50 # ms, GPIO edge-detection debounce
+RESIZE_SETTLE_FRAMES = 2 # frames a new window size must persist before surfaces are rebuilt
+FRAME_RATE = 60 # frames per second, paced by the main loop
+FRAME_SPIN_MARGIN = 0 # seconds before a frame deadline to busy-wait instead of sleep; 0 disables spinning
 # -----------------------------------------------------------------------------
 
 # Colors
@@ -59,6 +71,8 @@ class FontSizes:
     REGULAR = 24
     SUBTEXT = 40
     TITLE = 128
+
+TEXT_CACHE_SIZE = 512 # Max number of rendered text surfaces kept by the AssetManager
 # -----------------------------------------------------------------------------
 
 # Text Strings
@@ -83,6 +97,27 @@ STRINGS_ENGLISH = {
     "until_reset": "until reset"
 }
 
+# Language code -> string table, resolved once at startup
+STRINGS = {
+    "DE": STRINGS_GERMAN,
+    "EN": STRINGS_ENGLISH,
+}
+
+# -----------------------------------------------------------------------------
+# Pygame Event Whitelist
+# -----------------------------------------------------------------------------
+# Only these event types reach the Pygame queue; SDL drops everything else
+# (e.g. mouse motion) during its pump. Any new event type handled in
+# EventManager.process_pygame_events must be added here as well.
+COUNTDOWN_TIMER_EVENT = pygame.USEREVENT + 1 # posted once per second by pygame.time.set_timer during a countdown
+ALLOWED_PYGAME_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWEXPOSED,
+    COUNTDOWN_TIMER_EVENT,
+]
+
 # -----------------------------------------------------------------------------
 # Keyboard Input Mapping
 # -----------------------------------------------------------------------------
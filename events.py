@@ -8,6 +8,7 @@ class Events(Enum):
     BUTTON_ENTER = "BUTTON_ENTER"
     BUTTON_FLAG = "BUTTON_FLAG"
     QUIT = "QUIT"
+    COUNTDOWN_TICK = "COUNTDOWN_TICK"
     SPEED_1 = "SPEED_1"
     SPEED_2 = "SPEED_2"
     SPEED_3 = "SPEED_3"
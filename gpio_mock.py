@@ -10,6 +10,9 @@ IN = 1
 OUT = 0
 PUD_DOWN = 21
 PUD_UP = 22
+RISING = 31
+FALLING = 32
+BOTH = 33
 
 def setmode(mode):
     """Mock for RPi.GPIO.setmode. Prints the mode being set."""
@@ -41,6 +44,17 @@ def output(pin, value):
     """
     pass
 
+def add_event_detect(pin, edge, callback=None, bouncetime=None):
+    """
+    Mock for RPi.GPIO.add_event_detect. Prints the registration; the
+    callback is never invoked since no edges occur without hardware.
+    """
+    print(f"GPIO mock: add_event_detect({pin}, {edge}, bouncetime={bouncetime})")
+
+def remove_event_detect(pin):
+    """Mock for RPi.GPIO.remove_event_detect. Prints the pin being released."""
+    print(f"GPIO mock: remove_event_detect({pin})")
+
 def cleanup():
     """Mock for RPi.GPIO.cleanup. Prints a cleanup message."""
     print("GPIO mock: cleanup()")
@@ -1,9 +1,7 @@
 import queue
-import threading
 import platform
-import time
 import pygame
-from config import KEY_EVENT_MAP
+from config import KEY_EVENT_MAP, BUTTON_BOUNCE_TIME, COUNTDOWN_TIMER_EVENT, DEBUG
 from events import Events
 
 # Determine if the code is running on a Raspberry Pi
@@ -32,24 +30,21 @@ class Button:
         self.event_manager = event_manager
         self.pin = pin
         self.event = event
-        self.is_pressed = False
 
-    def handle_state(self, is_high):
+    def handle_edge(self, pin):
         """
-        Handles the button's state change. Triggers an event on the rising edge.
+        GPIO edge-detection callback. Called by RPi.GPIO from its own thread
+        on every debounced rising edge of this button's pin.
 
         Args:
-            is_high: True if the GPIO signal is high, False otherwise.
+            pin: The GPIO pin that triggered the callback.
         """
-        if is_high and not self.is_pressed:
-            self.is_pressed = True
-            self._trigger_event()
-        elif not is_high:
-            self.is_pressed = False
+        self._trigger_event()
 
     def _trigger_event(self):
         """Puts the button's designated event onto the event queue."""
-        print(f"Event: {self.event}")
+        if DEBUG:
+            print(f"Event: {self.event}")
         self.event_manager.event_queue.put(self.event)
 
 class EventManager:
@@ -58,9 +53,11 @@ class EventManager:
     """
     def __init__(self):
         """Initializes the EventManager, setting up the event queue and buttons."""
-        self.event_queue = queue.Queue()
+        self.event_queue = queue.SimpleQueue()  # Unbounded, C-implemented FIFO; no task tracking needed
         self.running = True
         self.resize_size = None  # Updated when a VIDEORESIZE event occurs
+        # Set when the window's contents must be presented in full again (exposed or resized)
+        self.needs_full_present = False
         
         # Maps GPIO pins to their corresponding events
         self.button_map = {
@@ -75,32 +72,27 @@ class EventManager:
 
         # Create Button instances from the map
         self.buttons = [Button(pin, event, self) for pin, event in self.button_map.items()]
-        self.gpio_thread = None
 
     def start(self):
         """
         Starts the input listeners.
-        Initializes GPIO on a Raspberry Pi and starts the listener thread.
+        Initializes GPIO on a Raspberry Pi and registers an edge-triggered
+        callback per button, so no thread has to poll the pins.
         """
         if IS_PI:
             GPIO.setmode(GPIO.BCM)
             for btn in self.buttons:
                 GPIO.setup(btn.pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-            
-            self.gpio_thread = threading.Thread(target=self._gpio_listener, daemon=True)
-            self.gpio_thread.start()
+                GPIO.add_event_detect(btn.pin, GPIO.RISING, callback=btn.handle_edge, bouncetime=BUTTON_BOUNCE_TIME)
 
     def stop(self):
-        """Stops the input listeners and joins any running threads."""
+        """Stops the input listeners and unregisters any GPIO callbacks."""
         self.running = False
         self.event_queue.put(Events.QUIT) # Ensure the main loop exits
-        
-        # Join the GPIO handling thread if it exists
-        if self.gpio_thread and self.gpio_thread.is_alive():
-            try:
-                self.gpio_thread.join()
-            except RuntimeError:
-                pass # Thread may not have been started
+
+        if IS_PI:
+            for btn in self.buttons:
+                GPIO.remove_event_detect(btn.pin)
 
     def get_events(self):
         """
@@ -110,45 +102,40 @@ class EventManager:
             A list of all events that have occurred since the last call.
         """
         events = []
-        while not self.event_queue.empty():
+        # Drain until empty in one pass; avoids a separate empty() check per item
+        while True:
             try:
                 event = self.event_queue.get_nowait()
-                if event is Events.QUIT:
-                    self.running = False
-                events.append(event)
             except queue.Empty:
                 break
+            if event is Events.QUIT:
+                self.running = False
+            events.append(event)
         return events
     
     def process_pygame_events(self):
         """
         Processes Pygame events (like keyboard input and window close)
-        and adds them to the internal event queue.
+        and adds them to the internal event queue. Only event types listed in
+        config.ALLOWED_PYGAME_EVENTS are delivered by Pygame.
         """
+        # Bind hot lookups to locals; this runs every frame
+        put = self.event_queue.put
+        lookup = KEY_EVENT_MAP.get
         for py_event in pygame.event.get():
-            if py_event.type == pygame.QUIT:
-                self.event_queue.put(Events.QUIT)
-            elif py_event.type == pygame.KEYDOWN:
-                if py_event.key in KEY_EVENT_MAP:
-                    self.event_queue.put(KEY_EVENT_MAP[py_event.key])
-            elif py_event.type == pygame.VIDEORESIZE:
+            event_type = py_event.type
+            if event_type == pygame.KEYDOWN:
+                event = lookup(py_event.key)
+                if event is not None:
+                    put(event)
+            elif event_type == pygame.QUIT:
+                put(Events.QUIT)
+            elif event_type == pygame.VIDEORESIZE:
                 # Store the new size so main loop can adjust surfaces
                 self.resize_size = (py_event.w, py_event.h)
-
-    def _gpio_listener(self):
-        """
-        Continuously listens for GPIO pin state changes and updates buttons.
-        This method runs in a separate thread.
-        """
-        while self.running:
-            for btn in self.buttons:
-                is_high = (GPIO.input(btn.pin) != 0)
-                btn.handle_state(is_high)
-            time.sleep(0.02) # Small delay to prevent busy-looping
-
-
-
-
-
-
-
+                self.needs_full_present = True
+            elif event_type == pygame.WINDOWEXPOSED:
+                # Uncovered or restored: the window system may have discarded its contents
+                self.needs_full_present = True
+            elif event_type == COUNTDOWN_TIMER_EVENT:
+                put(Events.COUNTDOWN_TICK)
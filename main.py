@@ -3,6 +3,8 @@ from input import EventManager
 from events import Events
 from views import GameView, View, StartView, EmptyView
 import sys
+import mmap
+import time
 import platform
 import config
 from assets import AssetManager
@@ -18,16 +20,21 @@ class Application:
     def __init__(self):
         """Initializes the application, loading assets and setting up the game context."""
         pygame.init()
+        # Block all event types except the ones the game handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(config.ALLOWED_PYGAME_EVENTS)
         
-        self.asset_manager = AssetManager()
         self.event_listener = EventManager()
         
         self._parse_args()
         self._init_display()
+        # Assets are loaded after the display exists so images can be converted to its format
+        self.asset_manager = AssetManager()
         # Use actual window size to initialize logical screen and backbuffer
         win_w, win_h = self.display_surface.get_size() if self.display_surface else (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
         screen = Screen(win_w, win_h, config.COLOR_DEPTH)
         layer0 = pygame.Surface((screen.width, screen.height), depth=screen.color_depth)
+        self._init_framebuffer(layer0.get_buffer().length)
 
         self.context = GameManager(
             screen,
@@ -45,6 +52,9 @@ class Application:
         self.context.set_view(view)
         
         self.running = True
+        # Window size reported by the latest VIDEORESIZE, applied once it settles
+        self._pending_resize = None
+        self._pending_resize_frames = 0
 
     def _parse_args(self):
         """Parses command-line arguments.
@@ -58,7 +68,7 @@ class Application:
             raise ValueError("Invalid Arguments, use: main.py <LANGUAGE> <MINECOUNT> [--ai-debug]")
 
         lang_arg = sys.argv[1].upper()
-        if lang_arg in ["DE", "EN"]:
+        if lang_arg in config.STRINGS:
             self.language = lang_arg
         else:
             raise ValueError("Invalid language argument. Use DE or EN.")
@@ -98,29 +108,38 @@ class Application:
         else:
             self.display_surface = None
 
+    def _init_framebuffer(self, size):
+        """
+        On a Raspberry Pi, opens /dev/fb0 once and memory-maps it so each
+        frame is a plain memory copy instead of an open/write/close cycle.
+
+        Args:
+            size: The number of bytes to map (the size of one frame).
+        """
+        self._fb_file = None
+        self.framebuffer = None
+        if not IS_PI:
+            return
+        try:
+            self._fb_file = open(config.FRAMEBUFFER_PATH, "r+b")
+            self.framebuffer = mmap.mmap(self._fb_file.fileno(), size)
+        except (IOError, ValueError) as e:
+            print(f"Error mapping framebuffer: {e}")
+            if self._fb_file:
+                self._fb_file.close()
+                self._fb_file = None
+
     def run(self):
-        """Runs the main game loop."""
+        """Runs the main game loop, paced to config.FRAME_RATE."""
+        frame_period = 1.0 / config.FRAME_RATE
+        next_frame = time.perf_counter()
         while self.running:
             # Process all pending input events
             self.event_listener.process_pygame_events()
 
             # Handle window resize requested via EventManager
-            if not IS_PI and getattr(self.event_listener, 'resize_size', None):
-                new_w, new_h = self.event_listener.resize_size
-                self.event_listener.resize_size = None
-                # Recreate layer0 with new size while keeping logical game surface size
-                self.context.screen.width = new_w
-                self.context.screen.height = new_h
-                self.context.layer0 = pygame.Surface((new_w, new_h), depth=self.context.screen.color_depth)
-                # Update current view's reference to layer0 if present
-                if hasattr(self.context.current_view, 'layer0'):
-                    self.context.current_view.layer0 = self.context.layer0
-                # Views may rely on offsets; force re-init of current view UI if it has that method
-                if hasattr(self.context.current_view, '_init_ui_elements'):
-                    try:
-                        self.context.current_view._init_ui_elements()
-                    except Exception as e:
-                        print(f"Resize re-init failed: {e}")
+            if not IS_PI:
+                self._handle_resize()
 
             # Handle queued game events
             for event in self.event_listener.get_events():
@@ -135,17 +154,96 @@ class Application:
                 self.context.set_view(next_view)
 
             # Draw the current view to the off-screen buffer
-            self.context.current_view.draw()
-            
+            dirty_rects = self.context.current_view.draw()
+            # After an expose or resize the window content is stale outside the
+            # view's dirty areas, so the whole buffer is presented once
+            if self.event_listener.needs_full_present:
+                dirty_rects = None
+                self.event_listener.needs_full_present = False
+
             # Render the buffer to the screen
-            render(self.context.layer0, self.display_surface)
+            render(self.context.layer0, self.display_surface, self.framebuffer, dirty_rects)
+
+            # Wait for the next frame deadline; if a frame overran, restart the
+            # schedule from now instead of rushing to catch up
+            next_frame += frame_period
+            if next_frame < time.perf_counter():
+                next_frame = time.perf_counter()
+            self._wait_until(next_frame)
 
         self.cleanup()
 
+    def _wait_until(self, deadline):
+        """
+        Blocks until the given time by sleeping, accepting the usual sleep
+        jitter. A non-zero config.FRAME_SPIN_MARGIN opts in to spinning for
+        the last part of the wait for tighter pacing, at the cost of CPU time.
+
+        Args:
+            deadline: The target time, in time.perf_counter() seconds.
+        """
+        spin_margin = config.FRAME_SPIN_MARGIN
+        remaining = deadline - time.perf_counter() - spin_margin
+        if remaining > 0:
+            time.sleep(remaining)
+        if spin_margin:
+            while time.perf_counter() < deadline:
+                time.sleep(0)  # Yield to other threads (e.g. GPIO callbacks) while spinning
+
+    def _handle_resize(self):
+        """
+        Debounces window resizes. While the user drags the window a new size
+        arrives nearly every frame; the backbuffer is only reallocated once the
+        same size has persisted for config.RESIZE_SETTLE_FRAMES frames.
+        """
+        if self.event_listener.resize_size:
+            if self.event_listener.resize_size != self._pending_resize:
+                self._pending_resize = self.event_listener.resize_size
+                self._pending_resize_frames = 0
+            self.event_listener.resize_size = None
+
+        if self._pending_resize is None:
+            return
+        self._pending_resize_frames += 1
+        if self._pending_resize_frames >= config.RESIZE_SETTLE_FRAMES:
+            self._apply_resize(*self._pending_resize)
+            self._pending_resize = None
+
+    def _apply_resize(self, new_w, new_h):
+        """
+        Recreates layer0 at the new window size and re-lays out the current view.
+
+        Args:
+            new_w: The new window width.
+            new_h: The new window height.
+        """
+        # The backbuffer is only rebuilt if its size changed; the window itself is
+        # presented in full either way on the next frame
+        self.event_listener.needs_full_present = True
+        if (new_w, new_h) == self.context.layer0.get_size():
+            return
+        # Recreate layer0 with new size while keeping logical game surface size
+        self.context.screen.width = new_w
+        self.context.screen.height = new_h
+        self.context.layer0 = pygame.Surface((new_w, new_h), depth=self.context.screen.color_depth)
+        # Update current view's reference to layer0 if present
+        if hasattr(self.context.current_view, 'layer0'):
+            self.context.current_view.layer0 = self.context.layer0
+        # Views may rely on offsets; force re-init of current view UI if it has that method
+        if hasattr(self.context.current_view, '_init_ui_elements'):
+            try:
+                self.context.current_view._init_ui_elements()
+            except Exception as e:
+                print(f"Resize re-init failed: {e}")
+
     def cleanup(self):
         """Performs cleanup operations before exiting the game."""
         print("Shutting down...")
         self.event_listener.stop()
+        if self.framebuffer:
+            self.framebuffer.close()
+        if self._fb_file:
+            self._fb_file.close()
         pygame.quit()
         sys.exit()
 
@@ -173,6 +271,7 @@ class GameManager:
         self.event_listener = event_listener
         self.layer0 = layer0 # The main off-screen drawing surface
         self.language = language
+        self.strings = config.STRINGS[language] # Localized UI strings for the chosen language
         self.minecount = minecount
         self.asset_manager = asset_manager
         self.current_view = None
@@ -190,23 +289,39 @@ class GameManager:
        Args:
            view: The View instance to be displayed.
        """
-       print(f"Switching view to {type(view).__name__}")
+       if config.DEBUG:
+           print(f"Switching view to {type(view).__name__}")
        self.current_view = view
 
-def render(surface, display):
+def render(surface, display, framebuffer=None, dirty_rects=None):
     """
     Renders the main drawing surface to the screen.
-    On Raspberry Pi, it writes directly to the framebuffer.
-    On other platforms, it updates the Pygame display window.
+    On Raspberry Pi, it copies the surface into the memory-mapped framebuffer,
+    or writes to /dev/fb0 directly if no mapping is available.
+    On other platforms, it updates the Pygame display window: only the given
+    dirty areas when there are a few of them, otherwise the entire window.
+    An empty dirty list means the frame is unchanged and nothing is presented.
     """
+    if dirty_rects is not None and not dirty_rects:
+        return
     if IS_PI:
+        if framebuffer is not None:
+            framebuffer.seek(0)
+            framebuffer.write(surface.get_buffer())
+            return
         try:
-            with open("/dev/fb0", "wb") as framebuffer:
-                framebuffer.write(surface.get_buffer())
+            with open(config.FRAMEBUFFER_PATH, "wb") as fb:
+                fb.write(surface.get_buffer())
         except IOError as e:
             print(f"Error writing to framebuffer: {e}")
             # Fallback or error handling could be added here
     else:
+        # A handful of small rects is cheaper to update than the whole window; with
+        # none (nothing known) or many, a single full flip wins
+        if display and dirty_rects is not None and len(dirty_rects) <= config.DIRTY_RECT_LIMIT:
+            display.blits([(surface, rect, rect) for rect in dirty_rects], doreturn=False)
+            pygame.display.update(dirty_rects)
+            return
         if display:
             display.blit(surface, (0, 0))
         pygame.display.flip()
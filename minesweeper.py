@@ -1,11 +1,52 @@
 import random
+from collections import deque
+import config
 from verify import MinesweeperAI
 
 
+# Neighbor tables keyed by (height, width). Every new game on the same board size
+# reuses the table instead of rebuilding it; the tables must be treated as read-only.
+_NEIGHBOR_COORDS_CACHE = {}
+
+
+def get_neighbor_coords(height, width):
+    """
+    Returns the precomputed in-bounds neighbor positions of every cell on a
+    board of the given size, building the table on first request.
+
+    Args:
+        height: The height of the board.
+        width: The width of the board.
+
+    Returns:
+        A 2D list where entry [row][col] is a list of (row, col) tuples of
+        that cell's neighbors, excluding the cell itself.
+    """
+    table = _NEIGHBOR_COORDS_CACHE.get((height, width))
+    if table is None:
+        table = [
+            [
+                [
+                    (neighbor_row, neighbor_col)
+                    for neighbor_row in range(max(0, row_idx - 1), min(height, row_idx + 2))
+                    for neighbor_col in range(max(0, col_idx - 1), min(width, col_idx + 2))
+                    if (neighbor_row, neighbor_col) != (row_idx, col_idx)
+                ]
+                for col_idx in range(width)
+            ]
+            for row_idx in range(height)
+        ]
+        _NEIGHBOR_COORDS_CACHE[(height, width)] = table
+    return table
+
+
 class Cell:
     """
     Represents a single cell on the Minesweeper board.
     """
+    # Fixed attribute layout: no per-instance __dict__, fewer bytes per cell
+    __slots__ = ("row", "col", "is_mine", "is_revealed", "is_flagged", "adjacent_mines")
+
     def __init__(self, row, col):
         """
         Initializes a Cell.
@@ -76,12 +117,15 @@ class Minesweeper:
         self.width = width
         self.num_mines = num_mines
         self.cells = []            # 2D list of Cell objects
-        self.mines = set()         # Set of (row, col) mine positions for O(1) lookup
+        self.mine_bits = 0         # Bitmask of mine positions, bit (row * width + col)
         self.selector = CellSelector(height, width)
         self.is_game_over = False
         self.is_win = False
         self.first_safe_move = None  # Seed cell for AI solvability verification
         self.revealed_safe_cells = 0  # Count of revealed non-mine cells
+        self.dirty_cells = set()  # (row, col) of cells whose state changed since the view last drew them
+        # Board dimensions never change, so each cell's in-bounds neighbors are looked up once
+        self.neighbor_coords = get_neighbor_coords(height, width)
 
     def init(self):
         """
@@ -93,10 +137,14 @@ class Minesweeper:
         max_attempts = 100000  # Prevent infinite loops in extreme cases
 
         while attempts < max_attempts:
-            print(f"Board generation attempt {attempts + 1}")
+            if config.DEBUG or (attempts + 1) % config.BOARD_ATTEMPT_LOG_INTERVAL == 0:
+                print(f"Board generation attempt {attempts + 1}")
             self._generate_board()
             self._find_first_safe_move()
             attempts += 1
+            # Reject hopeless boards cheaply before building an AI for them
+            if not self._is_candidate_board():
+                continue
             if self._is_board_solvable():
                 print("Solvable board generated.")
                 break
@@ -108,32 +156,40 @@ class Minesweeper:
         """
         # Create cells
         self.cells = [[Cell(row_idx, col_idx) for col_idx in range(self.width)] for row_idx in range(self.height)]
-        self.mines.clear()
+        self.mine_bits = 0
         self.revealed_safe_cells = 0
 
-        # Place mines
-        mines_to_place = self.num_mines
-        while mines_to_place > 0:
-            row_idx = random.randint(0, self.height - 1)
-            col_idx = random.randint(0, self.width - 1)
-
+        # Place mines: draw all distinct positions in a single call instead of rejection sampling
+        mine_cells = []
+        for index in random.sample(range(self.height * self.width), self.num_mines):
+            row_idx, col_idx = divmod(index, self.width)
             cell = self.cells[row_idx][col_idx]
-            if not cell.is_mine:
-                cell.is_mine = True
-                self.mines.add((row_idx, col_idx))
-                mines_to_place -= 1
-
-        # Calculate adjacent mines for each cell
-        for row_idx in range(self.height):
-            for col_idx in range(self.width):
-                cell = self.cells[row_idx][col_idx]
-                if not cell.is_mine:
-                    cell.adjacent_mines = sum(
-                        1
-                        for neighbor_row in range(row_idx - 1, row_idx + 2)
-                        for neighbor_col in range(col_idx - 1, col_idx + 2)
-                        if (neighbor_row, neighbor_col) in self.mines and (neighbor_row, neighbor_col) != (row_idx, col_idx)
-                    )
+            cell.is_mine = True
+            self.mine_bits |= 1 << index
+            mine_cells.append(cell)
+
+        # Calculate adjacent mines by scattering each mine's count onto its neighbors,
+        # which touches 9 cells per mine rather than 9 cells per board cell.
+        # Mine membership is read from the cells themselves; no position tuples are built.
+        for mine_cell in mine_cells:
+            for neighbor_row, neighbor_col in self.neighbor_coords[mine_cell.row][mine_cell.col]:
+                neighbor = self.cells[neighbor_row][neighbor_col]
+                if not neighbor.is_mine:
+                    neighbor.adjacent_mines += 1
+
+    @property
+    def mines(self):
+        """
+        The set of (row, col) mine positions, decoded from mine_bits on demand.
+        Hot paths should test mine_bits or Cell.is_mine directly instead.
+        """
+        positions = set()
+        bits = self.mine_bits
+        while bits:
+            low_bit = bits & -bits
+            positions.add(divmod(low_bit.bit_length() - 1, self.width))
+            bits ^= low_bit
+        return positions
 
     def _find_first_safe_move(self):
         """Select a starting safe cell preferring zero-adjacent-mine cells.
@@ -143,44 +199,47 @@ class Minesweeper:
         2. If any exist, choose one randomly (adds variation, all equivalent informationally).
         3. Otherwise, fall back to any non-mine cell (original behavior) so the game can proceed.
         """
-        zero_adj = []
-        fallback = None
-        for row_idx in range(self.height):
-            for col_idx in range(self.width):
-                cell = self.cells[row_idx][col_idx]
-                if not cell.is_mine:
-                    if fallback is None:
-                        fallback = (row_idx, col_idx)
-                    if cell.adjacent_mines == 0:
-                        zero_adj.append((row_idx, col_idx))
+        # Flat comprehensions filter the board in C-level loops instead of nested Python branching
+        safe_cells = [cell for row in self.cells for cell in row if not cell.is_mine]
+        zero_adj = [cell for cell in safe_cells if cell.adjacent_mines == 0]
         if zero_adj:
-            self.first_safe_move = random.choice(zero_adj)
+            cell = random.choice(zero_adj)
+        elif safe_cells:
+            cell = safe_cells[0]
         else:
-            self.first_safe_move = fallback
+            self.first_safe_move = None
+            return
+        self.first_safe_move = (cell.row, cell.col)
 
     def reveal_cell(self, row, col):
         """
         Reveals the cell at the given position. If the cell has no adjacent
-        mines, it recursively reveals its neighbors.
+        mines, its neighbors are revealed as well, flooding outwards
+        iteratively so large open regions do not recurse.
         """
-        cell = self.cells[row][col]
-        if cell.is_revealed or cell.is_flagged:
-            return
+        pending = deque([(row, col)])
+        while pending:
+            row, col = pending.popleft()
+            cell = self.cells[row][col]
+            if cell.is_revealed or cell.is_flagged:
+                continue
 
-        cell.is_revealed = True
+            cell.is_revealed = True
+            self.dirty_cells.add((row, col))
+
+            if cell.is_mine:
+                self.is_game_over = True
+                continue
 
-        if cell.is_mine:
-            self.is_game_over = True
-        else:
             # Increment when revealing a safe cell
             self.revealed_safe_cells += 1
             if cell.adjacent_mines == 0:
-                # Reveal neighboring cells if there are no adjacent mines
-                for neighbor_row in range(row - 1, row + 2):
-                    for neighbor_col in range(col - 1, col + 2):
-                        if 0 <= neighbor_row < self.height and 0 <= neighbor_col < self.width and not self.cells[neighbor_row][neighbor_col].is_revealed:
-                            self.reveal_cell(neighbor_row, neighbor_col)
-        
+                # Queue neighboring cells if there are no adjacent mines; the
+                # precomputed table already excludes out-of-bounds positions
+                for neighbor_row, neighbor_col in self.neighbor_coords[row][col]:
+                    if not self.cells[neighbor_row][neighbor_col].is_revealed:
+                        pending.append((neighbor_row, neighbor_col))
+
         if not self.is_game_over:
             self._check_win_condition()
 
@@ -204,6 +263,24 @@ class Minesweeper:
         cell = self.cells[row][col]
         if not cell.is_revealed:
             cell.is_flagged = not cell.is_flagged
+            self.dirty_cells.add((row, col))
+
+    def _is_candidate_board(self):
+        """
+        Cheap necessary condition for solvability, checked before the full AI run.
+
+        A seed clue greater than zero gives the AI a single constraint that is
+        neither "all safe" nor "all mines" (unless every neighbor is a mine), so
+        no further safe cell can be deduced. Such a board is only solvable if the
+        seed is the one and only safe cell.
+
+        Returns:
+            True if the board is worth verifying with the AI, False otherwise.
+        """
+        if not self.first_safe_move:
+            return False
+        seed = self.cells[self.first_safe_move[0]][self.first_safe_move[1]]
+        return seed.adjacent_mines == 0 or self.width * self.height - self.num_mines == 1
 
     def _is_board_solvable(self):
         """
@@ -257,9 +334,4 @@ class Minesweeper:
         Returns:
             A list of neighboring cell objects.
         """
-        neighbors = []
-        for neighbor_row in range(cell.row - 1, cell.row + 2):
-            for neighbor_col in range(cell.col - 1, cell.col + 2):
-                if (neighbor_row, neighbor_col) != (cell.row, cell.col) and 0 <= neighbor_row < self.height and 0 <= neighbor_col < self.width:
-                    neighbors.append(self.cells[neighbor_row][neighbor_col])
-        return neighbors
+        return [self.cells[neighbor_row][neighbor_col] for neighbor_row, neighbor_col in self.neighbor_coords[cell.row][cell.col]]
@@ -1,4 +1,38 @@
 import random
+from collections import deque
+
+
+# Neighbor bitmask tables keyed by (width, height). The solver is rebuilt for every
+# board generation attempt, so the table is shared rather than recomputed per instance.
+_NEIGHBOR_MASK_CACHE = {}
+
+
+def get_neighbor_masks(width, height):
+    """
+    Returns, for every cell index (row * width + col), the bitmask of its
+    in-bounds neighbors, building the table on first request.
+
+    Args:
+        width: The width of the game board.
+        height: The height of the game board.
+
+    Returns:
+        A list of ints of length width * height.
+    """
+    masks = _NEIGHBOR_MASK_CACHE.get((width, height))
+    if masks is None:
+        masks = []
+        for row in range(height):
+            for col in range(width):
+                neighbor_mask = 0
+                for neighbor_row in range(max(0, row - 1), min(height, row + 2)):
+                    for neighbor_col in range(max(0, col - 1), min(width, col + 2)):
+                        if (neighbor_row, neighbor_col) != (row, col):
+                            neighbor_mask |= 1 << (neighbor_row * width + neighbor_col)
+                masks.append(neighbor_mask)
+        _NEIGHBOR_MASK_CACHE[(width, height)] = masks
+    return masks
+
 
 class MinesweeperAI:
     """
@@ -18,8 +52,55 @@ class MinesweeperAI:
         self.moves_made = set()
         self.safes = set()
         self.mines = set()
-        # Collection of constraint equations (each relates a set of cells to a mine count)
-        self.constraints = []
+        # Bitmask mirrors of safes/mines; bit index is row * width + col
+        self.safe_mask = 0
+        self.mine_mask = 0
+        self.neighbor_masks = get_neighbor_masks(width, height)
+        # Constraint equations (each relates a set of cells to a mine count), keyed by
+        # their cell mask so deduplication and membership are O(1) int hash lookups
+        self.constraints = {}
+        # Inverted index: cell bit -> set of masks of the constraints containing that cell
+        self.cell_to_constraints = {}
+        # Masks of constraints added or changed since they were last inspected;
+        # a constraint's dirty flag tells whether its entry still needs processing
+        self.worklist = deque()
+        # Every mask ever stored. Cells only ever go from unknown to known, so a mask
+        # that was stored once can never become a new constraint again.
+        self._seen_masks = set()
+
+    def cell_bit(self, cell):
+        """
+        Returns the single-bit mask of a cell.
+
+        Args:
+            cell: The (row, col) position of the cell.
+        """
+        return 1 << (cell[0] * self.width + cell[1])
+
+    def bits_of(self, mask):
+        """
+        Iterates over the single-bit masks of all cells set in a bitmask.
+
+        Args:
+            mask: A bitmask of cells.
+        """
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit
+            mask ^= low_bit
+
+    def cells_of(self, mask):
+        """
+        Iterates over the (row, col) positions of all cells set in a bitmask,
+        walking the set bits from lowest to highest.
+
+        Args:
+            mask: A bitmask of cells.
+        """
+        while mask:
+            low_bit = mask & -mask
+            yield divmod(low_bit.bit_length() - 1, self.width)
+            mask ^= low_bit
 
     def mark_mine(self, cell):
         """
@@ -27,8 +108,13 @@ class MinesweeperAI:
         """
         if cell not in self.mines:
             self.mines.add(cell)
-            for constraint in self.constraints:
-                constraint.mark_mine(cell)
+            bit = self.cell_bit(cell)
+            self.mine_mask |= bit
+            # Only the constraints listed in the index for this cell can contain it
+            for mask in list(self.cell_to_constraints.get(bit, ())):
+                constraint = self._discard_constraint(mask)
+                constraint.mark_mine(bit)
+                self._store_constraint(constraint)
         
     def mark_safe(self, cell):
         """
@@ -36,8 +122,94 @@ class MinesweeperAI:
         """
         if cell not in self.safes:
             self.safes.add(cell)
-            for constraint in self.constraints:
-                constraint.mark_safe(cell)
+            bit = self.cell_bit(cell)
+            self.safe_mask |= bit
+            for mask in list(self.cell_to_constraints.get(bit, ())):
+                constraint = self._discard_constraint(mask)
+                constraint.mark_safe(bit)
+                self._store_constraint(constraint)
+
+    def _affected_constraints(self, mask):
+        """
+        Returns the masks of all constraints sharing at least one cell with a bitmask.
+
+        Args:
+            mask: A bitmask of cells.
+        """
+        index = self.cell_to_constraints
+        affected = set()
+        for bit in self.bits_of(mask):
+            # Cells no stored constraint has touched yet have no index entry
+            bucket = index.get(bit)
+            if bucket:
+                affected |= bucket
+        return affected
+
+    def mark_mines(self, mask):
+        """
+        Marks every cell of a bitmask as a mine. Each constraint containing any
+        of the cells is re-keyed once, rather than once per cell.
+
+        Args:
+            mask: A bitmask of cells known to be mines.
+        """
+        new_mines = mask & ~self.mine_mask
+        if not new_mines:
+            return
+        self.mine_mask |= new_mines
+        self.mines.update(self.cells_of(new_mines))
+        for affected_mask in self._affected_constraints(new_mines):
+            constraint = self._discard_constraint(affected_mask)
+            constraint.mark_mine(affected_mask & new_mines)
+            self._store_constraint(constraint)
+
+    def mark_safes(self, mask):
+        """
+        Marks every cell of a bitmask as safe. Each constraint containing any
+        of the cells is re-keyed once, rather than once per cell.
+
+        Args:
+            mask: A bitmask of cells known to be safe.
+        """
+        new_safes = mask & ~self.safe_mask
+        if not new_safes:
+            return
+        self.safe_mask |= new_safes
+        self.safes.update(self.cells_of(new_safes))
+        for affected_mask in self._affected_constraints(new_safes):
+            constraint = self._discard_constraint(affected_mask)
+            constraint.mark_safe(affected_mask & new_safes)
+            self._store_constraint(constraint)
+
+    def _store_constraint(self, constraint):
+        """
+        Stores a constraint under its cell mask unless it is resolved (no cells
+        left) or a constraint over the same cells is, or was, already known. A stored
+        constraint is queued for inspection by evaluate_constraints.
+
+        Returns:
+            True if the constraint was added, False otherwise.
+        """
+        if not constraint.mask or constraint.mask in self._seen_masks:
+            return False
+        self._seen_masks.add(constraint.mask)
+        self.constraints[constraint.mask] = constraint
+        for bit in self.bits_of(constraint.mask):
+            self.cell_to_constraints.setdefault(bit, set()).add(constraint.mask)
+        self.worklist.append(constraint.mask)
+        return True
+
+    def _discard_constraint(self, mask):
+        """
+        Removes the constraint stored under a mask from the collection and the index.
+
+        Returns:
+            The removed Constraint.
+        """
+        constraint = self.constraints.pop(mask)
+        for bit in self.bits_of(mask):
+            self.cell_to_constraints[bit].discard(mask)
+        return constraint
 
     def add_constraint(self, cell, count):
         """
@@ -50,82 +222,83 @@ class MinesweeperAI:
         self.moves_made.add(cell)
         self.mark_safe(cell)
         
-        adjacent_cells = set()
-        known_mine_count = 0
-
-        # Iterate over neighbors to build the sentence
-        for r_offset in [-1, 0, 1]:
-            for c_offset in [-1, 0, 1]:
-                if r_offset == 0 and c_offset == 0:
-                    continue
-
-                adj_cell = (cell[0] + r_offset, cell[1] + c_offset)
-
-                if 0 <= adj_cell[0] < self.height and 0 <= adj_cell[1] < self.width:
-                    if adj_cell in self.mines:
-                        known_mine_count += 1
-                    elif adj_cell not in self.safes:
-                        adjacent_cells.add(adj_cell)
+        # Build the sentence from the precomputed neighborhood: unknown neighbors
+        # form the constraint, neighbors already known to be mines reduce its count
+        neighbor_mask = self.neighbor_masks[cell[0] * self.width + cell[1]]
+        known_mine_count = (neighbor_mask & self.mine_mask).bit_count()
+        adjacent_mask = neighbor_mask & ~(self.mine_mask | self.safe_mask)
 
         # Add the new constraint to our set
-        if adjacent_cells:
-            new_constraint = Constraint(adjacent_cells, count - known_mine_count)
-            if new_constraint not in self.constraints:
-                self.constraints.append(new_constraint)
+        self._store_constraint(Constraint(adjacent_mask, count - known_mine_count))
 
         # Evaluate after integrating new constraint
         self.evaluate_constraints()
 
     def evaluate_constraints(self):
         """
-        Continuously evaluates current constraints to infer new mines and safe cells
-        until no more inferences can be made.
-        """
-        made_inference = True
-        while made_inference:
-            made_inference = False
-            
-            # Infer safes and mines from simple sentences
-            safes_to_add = set()
-            mines_to_add = set()
-            for constraint in self.constraints:
-                if constraint.known_safes():
-                    safes_to_add.update(constraint.known_safes())
-                if constraint.known_mines():
-                    mines_to_add.update(constraint.known_mines())
-
-            if safes_to_add:
-                for safe in safes_to_add:
-                    if safe not in self.safes:
-                        self.mark_safe(safe)
-                        made_inference = True
-            
-            if mines_to_add:
-                for mine in mines_to_add:
-                    if mine not in self.mines:
-                        self.mark_mine(mine)
-                        made_inference = True
-
-            # Remove resolved (empty) constraints
-            self.constraints = [c for c in self.constraints if c.cells]
-
-            # Infer new constraints from subsets (C2 - C1)
-            constraints_copy = self.constraints[:]
-            for c1 in constraints_copy:
-                for c2 in constraints_copy:
-                    if c1.cells == c2.cells:
-                        continue
-                    
-                    if c1.cells.issubset(c2.cells):
-                        new_cells = c2.cells - c1.cells
-                        new_count = c2.count - c1.count
-                        new_constraint = Constraint(new_cells, new_count)
-                        
-                        if new_constraint not in self.constraints:
-                            self.constraints.append(new_constraint)
-                            made_inference = True
-
-                                    
+        Evaluates constraints to infer new mines and safe cells until no more
+        inferences can be made.
+
+        Works through a worklist: only constraints that were added or changed
+        since they were last inspected are processed, instead of rescanning
+        every constraint until nothing changes.
+        """
+        # Bind attributes and bound methods to locals; this loop is the solver's hot path
+        constraints = self.constraints
+        index = self.cell_to_constraints
+        worklist = self.worklist
+        pop_next = worklist.popleft
+        store = self._store_constraint
+        seen = self._seen_masks
+        bits_of = self.bits_of
+        while worklist:
+            mask = pop_next()
+            constraint = constraints.get(mask)
+            if constraint is None or not constraint.dirty:
+                continue  # Resolved, re-keyed, or already inspected at this fixpoint
+            constraint.dirty = False
+            count = constraint.count
+
+            # Infer safes and mines from simple sentences: no mines left means all
+            # cells are safe, as many mines as cells means all are mines. All cells
+            # are marked as one batch, which re-queues every constraint sharing one
+            if count == 0:
+                self.mark_safes(mask)
+                continue
+            if mask.bit_count() == count:
+                self.mark_mines(mask)
+                continue
+
+            # Infer new constraints from subsets, pairing this constraint with every
+            # constraint that shares a cell with it, in both directions
+            overlapping = set()
+            for bit in bits_of(mask):
+                overlapping |= index[bit]
+            for other_mask in overlapping:
+                # One AND serves both subset directions; most overlapping pairs are
+                # neither and are rejected by the two compares below. Derived masks that
+                # were already produced are skipped before any Constraint is built.
+                common = mask & other_mask
+                if common == mask:
+                    # This constraint is a subset of the other one (C2 - C1)
+                    new_mask = other_mask ^ mask
+                    if new_mask and new_mask not in seen:
+                        store(Constraint(new_mask, constraints[other_mask].count - count))
+                elif common == other_mask:
+                    # The other constraint is a subset of this one
+                    new_mask = mask ^ other_mask
+                    if new_mask not in seen:
+                        store(Constraint(new_mask, count - constraints[other_mask].count))
+
+    def pending_safe_count(self):
+        """
+        Returns the number of known safe cells that have not been moved to yet,
+        without building the set difference. Every move made is a known safe
+        cell (add_constraint marks its cell safe), so moves_made is a subset
+        of safes.
+        """
+        return len(self.safes) - len(self.moves_made)
+
     def make_safe_move(self):
         """
         Returns a safe cell to move to that has not already been moved to.
@@ -142,10 +315,21 @@ class MinesweeperAI:
         """
         Returns a random, valid move that has not yet been made or identified as a mine.
         """
-        all_cells = set((r, c) for r in range(self.height) for c in range(self.width))
-        possible_moves = all_cells - self.moves_made - self.mines
+        # Rejection sampling: O(1) expected draws while the board is sparsely
+        # occupied, with no per-call set of all cells
+        cell_count = self.width * self.height
+        for _ in range(8 * cell_count):
+            move = divmod(random.randrange(cell_count), self.width)
+            if move not in self.moves_made and move not in self.mines:
+                return move
+
+        # Board (almost) fully occupied: choose among the cells that are left
+        possible_moves = [
+            (r, c) for r in range(self.height) for c in range(self.width)
+            if (r, c) not in self.moves_made and (r, c) not in self.mines
+        ]
         if possible_moves:
-            return random.choice(list(possible_moves))
+            return random.choice(possible_moves)
         return None
 
 
@@ -153,45 +337,29 @@ class Constraint:
     """
     Represents a constraint equation of the form:
     "A set of cells contains exactly N mines."
+    The set of cells is stored as a bitmask (bit row * width + col).
     """
-    def __init__(self, cells, count):
-        self.cells = set(cells)
+    def __init__(self, mask, count):
+        self.mask = mask
         self.count = count
-
-    def __eq__(self, other):
-        return isinstance(other, Constraint) and self.cells == other.cells and self.count == other.count
-
-    def __hash__(self):
-        return hash((frozenset(self.cells), self.count))
+        # Set whenever the constraint is new or has changed; cleared once the solver
+        # has inspected it, so stable constraints are skipped
+        self.dirty = True
 
     def __repr__(self):
-        return f"Constraint({self.cells}, {self.count})"
-
-    def known_mines(self):
-        """Returns all cells in the constraint if they are all mines."""
-        if len(self.cells) == self.count:
-            return self.cells
-        return None
-        
-    def known_safes(self):
-        """Returns all cells in the constraint if they are all safe."""
-        if self.count == 0:
-            return self.cells
-        return None
-        
-    def mark_mine(self, cell):
-        """Removes a cell from the constraint if it is known to be a mine."""
-        if cell in self.cells:
-            self.cells.remove(cell)
-            self.count -= 1
-
-    def mark_safe(self, cell):
-        """Removes a cell from the constraint if it is known to be safe."""
-        if cell in self.cells:
-            self.cells.remove(cell)
-
-
-
-
+        return f"Constraint({bin(self.mask)}, {self.count})"
 
+    def mark_mine(self, bits):
+        """Removes the cells of a bitmask (one or many) from the constraint if they are known to be mines."""
+        overlap = self.mask & bits
+        if overlap:
+            self.mask ^= overlap
+            self.count -= overlap.bit_count()
+            self.dirty = True
 
+    def mark_safe(self, bits):
+        """Removes the cells of a bitmask (one or many) from the constraint if they are known to be safe."""
+        overlap = self.mask & bits
+        if overlap:
+            self.mask ^= overlap
+            self.dirty = True
@@ -1,9 +1,33 @@
+from collections import deque
 from events import Events
 from minesweeper import Minesweeper
 from verify import MinesweeperAI
+from assets import convert_overlay
 import pygame
 import config
 
+# pygame-ce provides Surface.fblits, a faster blits without per-blit return values
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Color tuples used by the per-frame draw paths, resolved from the enum once
+_BLACK = config.Color.BLACK.value
+_WHITE = config.Color.WHITE.value
+_RED = config.Color.RED.value
+
+
+def blit_batch(surface, blit_list):
+    """
+    Blits a sequence of (source, dest) pairs onto a surface in a single call.
+
+    Args:
+        surface: The target pygame.Surface.
+        blit_list: A list of (source Surface, destination) tuples.
+    """
+    if _HAS_FBLITS:
+        surface.fblits(blit_list)
+    else:
+        surface.blits(blit_list, doreturn=False)
+
 # -----------------------------------------------------------------------------
 # Base View Class
 # -----------------------------------------------------------------------------
@@ -24,11 +48,12 @@ class View:
         self.language = self.context.language
         self.asset_manager = self.context.asset_manager
 
-        # Load language-specific strings
-        if self.language == "EN":
-            self.strings = config.STRINGS_ENGLISH
-        elif self.language == "DE":
-            self.strings = config.STRINGS_GERMAN
+        # Language-specific strings, resolved once by the GameManager
+        self.strings = self.context.strings
+
+        # Off-screen drawing surface provided by GameManager; Application._apply_resize
+        # rebinds it on the current view when the backbuffer is replaced
+        self.layer0 = self.context.layer0
 
     def handle_event(self, event):
         """
@@ -52,12 +77,41 @@ class View:
         """
         return self
 
+    def _layout_centers(self):
+        """
+        Stores the screen positions the title (_center) and the subtitle
+        (_subtext_center) are centered on, once per layout.
+        """
+        center_x, center_y = self.context.screen.get_center()
+        self._center = (center_x, center_y)
+        self._subtext_center = (center_x, center_y + 100)
+
+    def _compose_background(self, blit_list):
+        """
+        Pre-composites a static screen: a black surface the size of layer0 with
+        the given blits applied, so drawing it each frame is a single blit.
+
+        Args:
+            blit_list: A list of (source Surface, destination) tuples.
+
+        Returns:
+            A pygame.Surface in layer0's pixel format.
+        """
+        background = pygame.Surface(self.layer0.get_size(), 0, self.layer0)
+        background.fill(_BLACK)
+        blit_batch(background, blit_list)
+        return background
+
     def draw(self):
         """
         Draws the view's contents to the main screen buffer.
         To be implemented by subclasses.
+
+        Returns:
+            A list of the screen Rects that changed since the previous frame,
+            or None if the whole screen must be updated.
         """
-        pass
+        return None
 
 # -----------------------------------------------------------------------------
 # GameView: The main playable screen
@@ -71,25 +125,24 @@ class GameView(View):
         """Initializes the GameView, creating the Minesweeper instance and UI elements."""
         super().__init__(context)
 
-        self.clock = pygame.time.Clock()
-        # Off-screen drawing surface provided by GameManager
-        self.layer0 = self.context.layer0
-
         # Create the game logic instance
         self.minesweeper = Minesweeper(height=config.FIELD_SIZE[1], width=config.FIELD_SIZE[0], num_mines=self.context.minecount)
 
         # Mode handling: optionally run AI visualization across board generation attempts
-        self.mode = "ai_debug" if getattr(self.context, "ai_debug", False) else "play"
+        self.mode = "ai_debug" if self.context.ai_debug else "play"
         self._ai_started = False
+        # AI debug state exists in both modes (None/defaults in play), so it is read directly
+        self.generator = None
+        self.speed_factor = 1.0  # Continuous simulation speed factor (x multiplier). 1.0 is default.
+        self._overlay_safe = None
+        self._overlay_mine = None
         if self.mode == "ai_debug":
             # Do not pre-initialize; instead, show every attempt of board generation and AI reasoning
             self.generator = GeneratorDebugger(self.minesweeper)
-            # Continuous simulation speed factor (x multiplier). 1.0 is default.
-            self.speed_factor = 1.0
-            # Prepare translucent overlays
-            self._overlay_safe = pygame.Surface((config.CELL_SIZE, config.CELL_SIZE), pygame.SRCALPHA)
+            # Prepare translucent overlays, sized to the cell interior so the outline stays untinted
+            self._overlay_safe = convert_overlay(pygame.Surface((config.CELL_SIZE - 2, config.CELL_SIZE - 2), pygame.SRCALPHA))
             self._overlay_safe.fill((0, 200, 0, 70))
-            self._overlay_mine = pygame.Surface((config.CELL_SIZE, config.CELL_SIZE), pygame.SRCALPHA)
+            self._overlay_mine = convert_overlay(pygame.Surface((config.CELL_SIZE - 2, config.CELL_SIZE - 2), pygame.SRCALPHA))
             self._overlay_mine.fill((200, 0, 0, 90))
         else:
             # Initialize a solvable board and auto-reveal the first safe cell for a smooth start
@@ -108,6 +161,28 @@ class GameView(View):
         # Timestamp for when to transition to the fail view after a loss
         self.fail_transition_time = None
 
+        # Event dispatch tables: one dict lookup per event instead of an if/elif chain
+        selector = self.minesweeper.selector
+        self._play_handlers = {
+            Events.BUTTON_UP: lambda: selector.move(-1, 0),
+            Events.BUTTON_DOWN: lambda: selector.move(1, 0),
+            Events.BUTTON_RIGHT: lambda: selector.move(0, 1),
+            Events.BUTTON_LEFT: lambda: selector.move(0, -1),
+            Events.BUTTON_FLAG: self._flag_selected,
+            Events.BUTTON_ENTER: self._reveal_selected,
+        }
+        self._ai_debug_handlers = {
+            Events.BUTTON_ENTER: self._toggle_pause,
+            Events.BUTTON_RIGHT: self._step_paused,
+            Events.BUTTON_UP: self._speed_up,
+            Events.BUTTON_DOWN: self._slow_down,
+        }
+
+        # HUD text that changes with the game state: metric name -> (value, rendered surface).
+        # A metric is only re-rendered when its value differs from the cached one.
+        self._hud_cache = {name: (None, None) for name in ("revealed", "percent", "attempt", "safes", "mines", "speed")}
+        self._revealed_template = self.strings["revealed"].replace("{", "{{").replace("}", "}}") + " {0} / " + self.total_safe_cells_string
+
     def _init_ui_elements(self):
         """Creates surfaces and calculates offsets for all UI elements."""
         self.cell_size = config.CELL_SIZE
@@ -117,13 +192,30 @@ class GameView(View):
         self.grid_width_px = grid_width_px
         self.grid_height_px = grid_height_px
 
-        # Grid surface
-        self.grid_surface = pygame.Surface((grid_width_px, grid_height_px))
+        # Grid surface. Opaque surfaces share layer0's pixel format, so blitting them
+        # onto it is a straight copy instead of a per-pixel format conversion.
+        self.grid_surface = pygame.Surface((grid_width_px, grid_height_px), 0, self.layer0)
         self.grid_offset = (
             (self.context.screen.width - grid_width_px) // 2,
             (self.context.screen.height - grid_height_px) // 2,
         )
 
+        # Per-cell Rects in grid-surface and in screen coordinates, built once per layout
+        self._cell_rects = [
+            [pygame.Rect(col * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size) for col in range(self.minesweeper.width)]
+            for row in range(self.minesweeper.height)
+        ]
+        self._cell_screen_rects = [[rect.move(self.grid_offset) for rect in row] for row in self._cell_rects]
+
+        # Empty-grid template, built on first draw (see _build_grid_template)
+        self._grid_template = None
+        self._grid_template_colors = None
+        # What the grid surface currently shows, to detect when it must be redrawn
+        self._drawn_cells = None
+        self._drawn_mode = None
+        self._drawn_selected_pos = None
+        self._drawn_flash = False
+
         # Grid border
         grid_border_background_offset = 30
         grid_border_height = grid_height_px + grid_border_background_offset
@@ -132,13 +224,15 @@ class GameView(View):
             (self.context.screen.width - grid_border_width) // 2,
             (self.context.screen.height - grid_border_height) // 2,
         )
-        self.grid_border_surface = pygame.Surface((grid_border_width, grid_border_height))
+        self.grid_border_surface = pygame.Surface((grid_border_width, grid_border_height), 0, self.layer0)
 
         # AI debug: full-board flash overlays
-        if getattr(self, "mode", "play") == "ai_debug":
-            self.flash_surface_green = pygame.Surface((grid_width_px, grid_height_px), pygame.SRCALPHA)
+        self.flash_surface_green = None
+        self.flash_surface_red = None
+        if self.mode == "ai_debug":
+            self.flash_surface_green = convert_overlay(pygame.Surface((grid_width_px, grid_height_px), pygame.SRCALPHA))
             self.flash_surface_green.fill((0, 255, 0, 110))
-            self.flash_surface_red = pygame.Surface((grid_width_px, grid_height_px), pygame.SRCALPHA)
+            self.flash_surface_red = convert_overlay(pygame.Surface((grid_width_px, grid_height_px), pygame.SRCALPHA))
             self.flash_surface_red.fill((255, 0, 0, 110))
 
         # Progress bar
@@ -151,79 +245,105 @@ class GameView(View):
             (self.context.screen.width - progress_bar_surface_width) // 2,
             self.context.screen.height - ((self.context.screen.height - grid_height_px) // 4) - 20,
         )
-        self.progress_bar_surface = pygame.Surface((progress_bar_surface_width, progress_bar_surface_height))
+        self.progress_bar_surface = pygame.Surface((progress_bar_surface_width, progress_bar_surface_height), 0, self.layer0)
+        self._drawn_progress = None  # (percent, outline color, label) the bar surface shows
 
         # Text offsets
         self.progress_bar_label_center = (self.context.screen.width // 2, self.progress_bar_offset[1] - 15)
         self.progress_bar_percent_center = (progress_bar_surface_width // 2, progress_bar_surface_height // 2)
         self.title_center = (self.context.screen.width // 2, ((self.context.screen.height - grid_height_px) // 4) - 10)
 
+        # AI debug HUD layout: split the grid width into four equal slots and left-anchor each metric in its slot
+        slot_w = max(1, grid_width_px // 4)
+        self._hud_slot_xs = tuple(self.grid_offset[0] + i * slot_w for i in range(4))
+        self._hud_y = self.title_center[1] - self.asset_manager.font_subtext.get_height() // 2
+
+        # Screen areas of the HUD text that changes during a game: the progress bar (with its
+        # percentage), the revealed-cells label and, in AI debug mode, the metrics line
+        regular_height = self.asset_manager.font_regular.get_height()
+        subtext_height = self.asset_manager.font_subtext.get_height()
+        self._hud_rects = [
+            pygame.Rect(self.progress_bar_offset, (progress_bar_surface_width, progress_bar_surface_height)),
+            pygame.Rect(0, self.progress_bar_label_center[1] - regular_height // 2 - 1, self.context.screen.width, regular_height + 2),
+            pygame.Rect(0, self.title_center[1] - subtext_height // 2 - 1, self.context.screen.width, subtext_height + 2),
+        ]
+
     def _load_assets(self):
         """Loads fonts and images needed for this view."""
-        self.font_regular = self.asset_manager.get_font("regular")
-        self.font_title = self.asset_manager.get_font("title")
-        self.font_subtext = self.asset_manager.get_font("subtext")
-
-        self.image_crosshair = self.asset_manager.get_image("crosshair")
-        self.image_asteroid = self.asset_manager.get_image("asteroid")
-        self.image_background = self.asset_manager.get_image("background")
+        self.font_regular = self.asset_manager.font_regular
+        self.font_title = self.asset_manager.font_title
+        self.font_subtext = self.asset_manager.font_subtext
+
+        self.image_crosshair = self.asset_manager.image_crosshair
+        self.image_asteroid = self.asset_manager.image_asteroid
+        self.image_background = self.asset_manager.image_background
+
+        # Only the clues 0-8 can appear in a cell: render each glyph once, together with
+        # its top-left offset inside a cell so that it ends up centered
+        self._digit_surfaces = [self.asset_manager.get_text("regular", str(digit), config.Color.WHITE.value) for digit in range(9)]
+        cell_center = (config.CELL_SIZE // 2, config.CELL_SIZE // 2)
+        self._digit_offsets = [surface.get_rect(center=cell_center).topleft for surface in self._digit_surfaces]
+        # Same for the cell images
+        self._asteroid_offset = self.image_asteroid.get_rect(center=cell_center).topleft
+        self._crosshair_offset = self.image_crosshair.get_rect(center=cell_center).topleft
 
         self.outline_color = config.Color.CELL_OUTLINE.value
         self.cell_background_color = config.Color.DARK_BLUE.value
         
     def handle_event(self, event):
         """Handles user input for navigating and interacting with the grid."""
-        # In AI debug mode, allow pause/resume, single-step, and continuous speed controls
-        if getattr(self, "mode", "play") == "ai_debug":
-            if event == Events.BUTTON_ENTER:
-                # Toggle pause
-                if hasattr(self, "generator"):
-                    self.generator.paused = not getattr(self.generator, "paused", False)
-                return
-            if event == Events.BUTTON_RIGHT:
-                # Manual single step only when paused
-                if hasattr(self, "generator") and getattr(self.generator, "paused", False):
-                    done = self.generator.step_manual()
-                    if done:
-                        if self.minesweeper.first_safe_move:
-                            self.minesweeper.reveal_cell(*self.minesweeper.first_safe_move)
-                            self.minesweeper.selector.selected_pos = self.minesweeper.first_safe_move
-                        self.mode = "play"
-                return
-            # Dynamic continuous speed control with Up/Down arrows while in AI debug mode
-            if event == Events.BUTTON_UP:
-                # Increase speed by 25% per press, clamp to a reasonable max
-                self.speed_factor = min(self.speed_factor * 1.25, 250.0)
-                self._apply_sim_speed()
-                return
-            if event == Events.BUTTON_DOWN:
-                # Decrease speed by 20% per press (inverse of 1.25), clamp to a reasonable min
-                self.speed_factor = max(self.speed_factor / 1.25, 0.10)
-                self._apply_sim_speed()
+        # In AI debug mode, allow pause/resume, single-step, and continuous speed controls;
+        # events without an AI debug binding fall through to the regular controls
+        if self.mode == "ai_debug":
+            handler = self._ai_debug_handlers.get(event)
+            if handler:
+                handler()
                 return
         if self.minesweeper.is_game_over:
             return # Do not handle input if the game is over
 
-        selected_cell = self.minesweeper.selector.selected_pos
-
-        if event == Events.BUTTON_UP:
-            self.minesweeper.selector.move(-1, 0)
-        elif event == Events.BUTTON_DOWN:
-            self.minesweeper.selector.move(1, 0)
-        elif event == Events.BUTTON_RIGHT:
-            self.minesweeper.selector.move(0, 1)
-        elif event == Events.BUTTON_LEFT:
-            self.minesweeper.selector.move(0, -1)
-        elif event == Events.BUTTON_FLAG:
-            self.minesweeper.flag_cell(*selected_cell)
-        elif event == Events.BUTTON_ENTER:
-            self.minesweeper.reveal_cell(*selected_cell)
-            # If the move ends the game, set up the transition state
-            if self.minesweeper.is_game_over and not self.minesweeper.is_win:
-                self.outline_color = config.Color.RED.value
-                self.cell_background_color = config.Color.DARK_RED.value
-                self.fail_transition_time = pygame.time.get_ticks() + config.GAME_OVER_RESET_DELAY
-                    
+        handler = self._play_handlers.get(event)
+        if handler:
+            handler()
+
+    def _toggle_pause(self):
+        """AI debug: pauses or resumes the generator."""
+        if self.generator:
+            self.generator.paused = not self.generator.paused
+
+    def _step_paused(self):
+        """AI debug: advances a single step, only while paused."""
+        if self.generator and self.generator.paused:
+            done = self.generator.step_manual()
+            if done:
+                if self.minesweeper.first_safe_move:
+                    self.minesweeper.reveal_cell(*self.minesweeper.first_safe_move)
+                    self.minesweeper.selector.selected_pos = self.minesweeper.first_safe_move
+                self.mode = "play"
+
+    def _speed_up(self):
+        """AI debug: increases speed by 25% per press, clamped to a reasonable max."""
+        self.speed_factor = min(self.speed_factor * 1.25, 250.0)
+        self._apply_sim_speed()
+
+    def _slow_down(self):
+        """AI debug: decreases speed by 20% per press (inverse of 1.25), clamped to a reasonable min."""
+        self.speed_factor = max(self.speed_factor / 1.25, 0.10)
+        self._apply_sim_speed()
+
+    def _flag_selected(self):
+        """Flags or unflags the selected cell."""
+        self.minesweeper.flag_cell(*self.minesweeper.selector.selected_pos)
+
+    def _reveal_selected(self):
+        """Reveals the selected cell and sets up the fail transition if it was a mine."""
+        self.minesweeper.reveal_cell(*self.minesweeper.selector.selected_pos)
+        # If the move ends the game, set up the transition state
+        if self.minesweeper.is_game_over and not self.minesweeper.is_win:
+            self.outline_color = config.Color.RED.value
+            self.cell_background_color = config.Color.DARK_RED.value
+            self.fail_transition_time = pygame.time.get_ticks() + config.GAME_OVER_RESET_DELAY
+
     def update(self):
         """
         Updates the game state, checking for win/loss conditions and handling
@@ -236,7 +356,7 @@ class GameView(View):
                 self._ai_started = True
             # When paused, do not auto-advance
             done = False
-            if not getattr(self.generator, "paused", False):
+            if not self.generator.paused:
                 done = self.generator.step()
             if done:
                 # We now have a solvable board active in self.minesweeper
@@ -257,173 +377,272 @@ class GameView(View):
         return self # No view change
 
     def draw(self):
-        """Draws the entire game screen, including the grid and UI elements."""
+        """
+        Draws the entire game screen, including the grid and UI elements.
+
+        Returns:
+            The screen Rects of the cells and HUD areas that changed since the
+            previous frame, or None if the whole screen must be updated.
+        """
         # Calculate the percentage for progress bar
-        if getattr(self, "mode", "play") == "ai_debug":
-            ai_dbg = getattr(self.generator, "ai_dbg", None)
+        if self.mode == "ai_debug":
+            ai_dbg = self.generator.ai_dbg
             revealed_count = len(ai_dbg.ai.moves_made) if ai_dbg else 0
         else:
             revealed_count = self.minesweeper.revealed_safe_cells
         percent_finished = (revealed_count / self.total_safe_cells) if self.total_safe_cells > 0 else 0
 
-        self.layer0.fill(config.Color.BLACK.value)
+        self.layer0.fill(_BLACK)
         self.layer0.blit(self.image_background, (0, 0))
 
+        self._hud_changed = False
         self._draw_progress_bar(percent_finished)
-        self._draw_grid()
+        dirty_rects = self._draw_grid()
         self._draw_ui_text(percent_finished, revealed_count)
-        if getattr(self, "mode", "play") == "ai_debug":
+        if self.mode == "ai_debug":
             self._draw_ai_debug_hud()
-        
-        self.clock.tick(60)
+
+        # The flash covers the whole grid, so it and its removal update the full screen
+        flash_active = self.mode == "ai_debug" and self.generator.flash_active
+        if flash_active or self._drawn_flash:
+            dirty_rects = None
+        self._drawn_flash = flash_active
+
+        if dirty_rects is not None and self._hud_changed:
+            dirty_rects.extend(self._hud_rects)
+        return dirty_rects
 
     def _draw_grid(self):
-        """Draws the Minesweeper grid and its border."""
+        """
+        Draws the Minesweeper grid and its border. The grid surface persists
+        between frames; only cells that changed since the last frame are redrawn.
+
+        Returns:
+            The screen Rects of the redrawn cells, or None if the whole grid
+            (and border) was redrawn.
+        """
         # Draw frame
         self.grid_border_surface.fill(self.outline_color)
         self.layer0.blit(self.grid_border_surface, self.grid_border_offset)
 
-        # Draw all cells
-        for row in self.minesweeper.cells:
-            for cell in row:
+        minesweeper = self.minesweeper
+        cells = minesweeper.cells
+        dirty = minesweeper.dirty_cells
+
+        # Redraw everything on a new template (first frame, resize, loss colors), a new
+        # board, or when the way cells are depicted changes (AI debug -> play)
+        if self._grid_template_colors != (self.cell_background_color, self.outline_color):
+            self._build_grid_template()
+            self._drawn_cells = None
+        full_redraw = cells is not self._drawn_cells or self.mode != self._drawn_mode
+        if full_redraw:
+            self.grid_surface.blit(self._grid_template, (0, 0))
+            # Cells without content already look like the template; only the others (and the
+            # selection) are drawn. In AI debug mode these are exactly the AI's known cells,
+            # so the sets are walked directly (moves made are always known safes).
+            if self.mode == "ai_debug":
+                ai_dbg = self.generator.ai_dbg
+                if ai_dbg:
+                    dirty.update(ai_dbg.ai.mines)
+                    dirty.update(ai_dbg.ai.safes)
+            else:
+                dirty.update((cell.row, cell.col) for row in cells for cell in row if cell.is_revealed or cell.is_flagged)
+            dirty.add(minesweeper.selector.selected_pos)
+            self._drawn_cells = cells
+            self._drawn_mode = self.mode
+
+        # A selection change redraws the previously and the newly selected cell
+        selected_pos = minesweeper.selector.selected_pos
+        if selected_pos != self._drawn_selected_pos:
+            if self._drawn_selected_pos is not None:
+                dirty.add(self._drawn_selected_pos)
+            dirty.add(selected_pos)
+            self._drawn_selected_pos = selected_pos
+
+        cell_rects = []
+        if dirty and cells:
+            # Collect each cell's draw operations, then issue one batched call per category
+            template_blits = []
+            self._img_blits = []
+            self._num_blits = []
+            self._overlay_blits = []
+            for row, col in dirty:
+                cell = cells[row][col]
+                if not full_redraw:
+                    rect = self._cell_rects[row][col]
+                    template_blits.append((self._grid_template, rect, rect))
+                    cell_rects.append(self._cell_screen_rects[row][col])
                 self._draw_cell(cell)
-        # AI debug flash overlay on the grid surface
-        if getattr(self, "mode", "play") == "ai_debug":
-            gen = getattr(self, "generator", None)
-            if gen and gen.flash_active:
-                overlay = self.flash_surface_green if gen.flash_color == "green" else self.flash_surface_red
-                self.grid_surface.blit(overlay, (0, 0))
-        
+            # Restore the dirty cells from the template first; blits (not fblits) takes an area rect
+            self.grid_surface.blits(template_blits, doreturn=False)
+            # Cells do not overlap, so drawing category by category matches per-cell order
+            blit_batch(self.grid_surface, self._img_blits)
+            blit_batch(self.grid_surface, self._num_blits)
+            blit_batch(self.grid_surface, self._overlay_blits)
+
+            # Selected cell outline, drawn over the template's default outline
+            if selected_pos in dirty:
+                selected_row, selected_col = selected_pos
+                pygame.draw.rect(self.grid_surface, _RED, self._cell_rects[selected_row][selected_col], width=1)
+        dirty.clear()
+
         self.layer0.blit(self.grid_surface, self.grid_offset)
 
-    
+        # AI debug flash overlay, blended onto layer0 so the persistent grid surface stays clean
+        if self.mode == "ai_debug":
+            gen = self.generator
+            if gen.flash_active:
+                overlay = self.flash_surface_green if gen.flash_color == "green" else self.flash_surface_red
+                self.layer0.blit(overlay, self.grid_offset)
+
+        return None if full_redraw else cell_rects
+
+    def _build_grid_template(self):
+        """
+        Renders the empty grid, every cell's background and outline, into a
+        surface that is blitted as a whole when the grid is fully redrawn and
+        cell by cell to restore dirty cells.
+        """
+        self._grid_template = pygame.Surface((self.grid_width_px, self.grid_height_px), 0, self.grid_surface)
+        self._grid_template.fill(self.cell_background_color)
+        for row in self._cell_rects:
+            for rect in row:
+                pygame.draw.rect(self._grid_template, self.outline_color, rect, width=1)
+        self._grid_template_colors = (self.cell_background_color, self.outline_color)
 
     def _draw_progress_bar(self, percent_finished):
-        """Draws the progress bar and its fill."""
-        self.progress_bar_surface.fill(self.outline_color)
-        progress_bar_rect = pygame.Rect(
-            self.progress_bar_padding // 2, 
-            self.progress_bar_padding // 2, 
-            self.progress_bar_width * percent_finished, 
-            self.progress_bar_height
-        )
-        pygame.draw.rect(self.progress_bar_surface, config.Color.WHITE.value, progress_bar_rect)
+        """
+        Draws the progress bar, its fill and its percentage label. The bar
+        surface persists between frames and is only repainted when the
+        progress or the outline color changed.
+        """
+        text_percent = self._get_hud_text("percent", int(percent_finished * 100), "{0}%", self.font_regular, _BLACK)
+        progress_state = (percent_finished, self.outline_color, text_percent)
+        if progress_state != self._drawn_progress:
+            self.progress_bar_surface.fill(self.outline_color)
+            progress_bar_rect = pygame.Rect(
+                self.progress_bar_padding // 2, 
+                self.progress_bar_padding // 2, 
+                self.progress_bar_width * percent_finished, 
+                self.progress_bar_height
+            )
+            pygame.draw.rect(self.progress_bar_surface, _WHITE, progress_bar_rect)
+            self.progress_bar_surface.blit(text_percent, text_percent.get_rect(center=self.progress_bar_percent_center))
+            self._drawn_progress = progress_state
         self.layer0.blit(self.progress_bar_surface, self.progress_bar_offset)
 
+    def _get_hud_text(self, name, value, template, font, color):
+        """
+        Returns the rendered text of a HUD metric, re-rendering it only when its
+        value changed since the last frame.
+
+        Args:
+            name: The metric's key in the HUD cache.
+            value: The metric's current value.
+            template: A str.format template the value is inserted into.
+            font: The pygame.font.Font to render with.
+            color: The RGB color tuple of the text.
+
+        Returns:
+            A pygame.Surface object containing the rendered text.
+        """
+        cached_value, surface = self._hud_cache[name]
+        if surface is None or value != cached_value:
+            surface = convert_overlay(font.render(template.format(value), True, color))
+            self._hud_cache[name] = (value, surface)
+            self._hud_changed = True
+        return surface
+
     def _draw_ui_text(self, percent_finished, revealed_count):
         """Draws all text elements like the title and progress indicators."""
         # Revealed cells text
-        revealed_text = f"{self.strings['revealed']} {revealed_count} / {self.total_safe_cells_string}"
-        text_revealed = self.font_regular.render(revealed_text, True, config.Color.WHITE.value)
+        text_revealed = self._get_hud_text("revealed", revealed_count, self._revealed_template, self.font_regular, _WHITE)
         text_revealed_rect = text_revealed.get_rect(center=self.progress_bar_label_center)
 
-        # Progress bar percentage text
-        percent_text = f"{int(percent_finished * 100)}%"
-        text_percent = self.font_regular.render(percent_text, True, config.Color.BLACK.value)
-        percent_rect = text_percent.get_rect(center=self.progress_bar_percent_center)
-
         # Game title (hidden in AI debug mode to make room for debug HUD)
-        draw_title = getattr(self, "mode", "play") != "ai_debug"
+        draw_title = self.mode != "ai_debug"
         if draw_title:
-            text_title = self.font_title.render(config.GAME_TITLE, True, config.Color.WHITE.value)
+            text_title = self.asset_manager.get_text("title", config.GAME_TITLE, _WHITE)
             title_rect = text_title.get_rect(center=self.title_center)
 
         # Blit text to surfaces
-        self.progress_bar_surface.blit(text_percent, percent_rect)
         self.layer0.blit(text_revealed, text_revealed_rect)
         if draw_title:
             self.layer0.blit(text_title, title_rect)
 
     def _draw_cell(self, cell):
         """
-        Draws a single cell based on its state (hidden, revealed, flagged).
+        Queues the draw operations of a single cell's content based on its state
+        (hidden, revealed, flagged). Backgrounds, outlines and flushing the
+        queues are handled by _draw_grid.
 
         Args:
             cell: The Cell object to draw.
         """
-        rect = pygame.Rect(cell.col * self.cell_size, cell.row * self.cell_size, self.cell_size, self.cell_size)
-
-        # Draw cell background
-        self.grid_surface.fill(self.cell_background_color, rect)
+        rect = self._cell_rects[cell.row][cell.col]
 
         # Draw content based on state or AI debug overlays
-        if getattr(self, "mode", "play") == "ai_debug":
-            ai_dbg = getattr(self.generator, "ai_dbg", None)
+        if self.mode == "ai_debug":
+            ai_dbg = self.generator.ai_dbg
             pos = (cell.row, cell.col)
             if ai_dbg:
                 # Mines inferred by AI
                 if pos in ai_dbg.ai.mines:
-                    img_rect = self.image_asteroid.get_rect(center=rect.center)
-                    self.grid_surface.blit(self.image_asteroid, img_rect)
-                    self.grid_surface.blit(self._overlay_mine, rect)
+                    self._img_blits.append((self.image_asteroid, (rect.x + self._asteroid_offset[0], rect.y + self._asteroid_offset[1])))
+                    self._overlay_blits.append((self._overlay_mine, (rect.x + 1, rect.y + 1)))
                 # Moves made (revealed safes in AI reasoning)
                 elif pos in ai_dbg.ai.moves_made:
-                    num_text = self.font_regular.render(str(cell.adjacent_mines), True, config.Color.WHITE.value)
-                    num_rect = num_text.get_rect(center=rect.center)
-                    self.grid_surface.blit(num_text, num_rect)
+                    offset_x, offset_y = self._digit_offsets[cell.adjacent_mines]
+                    self._num_blits.append((self._digit_surfaces[cell.adjacent_mines], (rect.x + offset_x, rect.y + offset_y)))
                 # Known safes not yet moved to
                 elif pos in ai_dbg.ai.safes:
-                    self.grid_surface.blit(self._overlay_safe, rect)
+                    self._overlay_blits.append((self._overlay_safe, (rect.x + 1, rect.y + 1)))
         else:
             if cell.is_flagged:
-                img_rect = self.image_crosshair.get_rect(center=rect.center)
-                self.grid_surface.blit(self.image_crosshair, img_rect)
+                self._img_blits.append((self.image_crosshair, (rect.x + self._crosshair_offset[0], rect.y + self._crosshair_offset[1])))
             elif cell.is_revealed:
                 if cell.is_mine:
-                    img_rect = self.image_asteroid.get_rect(center=rect.center)
-                    self.grid_surface.blit(self.image_asteroid, img_rect)
+                    self._img_blits.append((self.image_asteroid, (rect.x + self._asteroid_offset[0], rect.y + self._asteroid_offset[1])))
                 else:
                     # Draw the number of adjacent mines
-                    num_text = self.font_regular.render(str(cell.adjacent_mines), True, config.Color.WHITE.value)
-                    num_rect = num_text.get_rect(center=rect.center)
-                    self.grid_surface.blit(num_text, num_rect)
-        
-        # Draw cell outline (red for selected, default otherwise)
-        outline_color = config.Color.RED.value if self.minesweeper.selector.selected_pos == (cell.row, cell.col) else self.outline_color
-        pygame.draw.rect(self.grid_surface, outline_color, rect, width=1)
+                    offset_x, offset_y = self._digit_offsets[cell.adjacent_mines]
+                    self._num_blits.append((self._digit_surfaces[cell.adjacent_mines], (rect.x + offset_x, rect.y + offset_y)))
 
     def _draw_ai_debug_hud(self):
         """Draws AI debug info as four separate, fixed-position metrics to avoid jitter."""
-        ai_dbg = getattr(self.generator, "ai_dbg", None)
-        sf = getattr(self, 'speed_factor', 1.0)
+        ai_dbg = self.generator.ai_dbg
+        sf = self.speed_factor
 
         attempt_num = self.generator.attempt
         safe_moves_remaining = 0
         mines_found = 0
         if ai_dbg:
-            safe_moves_remaining = max(0, len(ai_dbg.ai.safes - ai_dbg.ai.moves_made))
+            safe_moves_remaining = max(0, ai_dbg.ai.pending_safe_count())
             mines_found = len(ai_dbg.ai.mines)
 
         total_mines = self.minesweeper.num_mines
 
-        # Prepare individual metric strings
-        text_attempt = f"Attempt {attempt_num}"
-        text_safes = f"Safe moves {safe_moves_remaining}"
-        text_mines = f"Mines {mines_found}/{total_mines}"
-        text_speed = f"Speed x{sf:.2f}"
-
-        # Layout: split the grid width into four equal slots and left-anchor each metric in its slot.
-        grid_left = self.grid_offset[0]
-        grid_width = self.grid_width_px
-        slots = 4
-        slot_w = max(1, grid_width // slots)
-        y = self.title_center[1] - self.font_subtext.get_height() // 2
-
-        metrics = [text_attempt, text_safes, text_mines, text_speed]
-        for i, txt in enumerate(metrics):
-            surf = self.font_subtext.render(txt, True, config.Color.WHITE.value)
-            x = grid_left + i * slot_w
-            self.layer0.blit(surf, (x, y))
+        # Metric surfaces, re-rendered only when their value changed
+        metrics = [
+            self._get_hud_text("attempt", attempt_num, "Attempt {0}", self.font_subtext, _WHITE),
+            self._get_hud_text("safes", safe_moves_remaining, "Safe moves {0}", self.font_subtext, _WHITE),
+            self._get_hud_text("mines", (mines_found, total_mines), "Mines {0[0]}/{0[1]}", self.font_subtext, _WHITE),
+            self._get_hud_text("speed", sf, "Speed x{0:.2f}", self.font_subtext, _WHITE),
+        ]
+
+        # All four metrics go to layer0 in one batched call, at the slots laid out in _init_ui_elements
+        y = self._hud_y
+        blit_batch(self.layer0, [(surf, (x, y)) for x, surf in zip(self._hud_slot_xs, metrics)])
 
     def _apply_sim_speed(self):
-        if not hasattr(self, 'generator'):
+        if not self.generator:
             return
         # Base timings at speed_factor == 1.0 (roughly old tier 3)
         base_step = 180
         base_attempt_pause = 250
         base_flash = 220
         base_post_flash = 220
-        sf = max(0.1, min(getattr(self, 'speed_factor', 1.0), 250.0))
+        sf = max(0.1, min(self.speed_factor, 250.0))
 
         # Scale timings inversely with speed factor, with minimum floors
         step_delay = max(1, int(round(base_step / sf)))
@@ -439,15 +658,15 @@ class GameView(View):
         gen.post_flash_pause_ms = post_flash
 
         # If there's an active AI stepper, update its pacing too
-        if getattr(gen, 'ai_dbg', None) is not None:
+        if gen.ai_dbg is not None:
             gen.ai_dbg.step_delay_ms = step_delay
 
         # Recalculate the next tick immediately based on current phase
-        if not getattr(gen, 'paused', False):
+        if not gen.paused:
             now = pygame.time.get_ticks()
             if gen._phase == "attempt":
                 # Respect AI stepper if present
-                if getattr(gen, 'ai_dbg', None) is not None:
+                if gen.ai_dbg is not None:
                     gen.ai_dbg._next_tick = now + step_delay
                 gen._next_tick = now + step_delay
             elif gen._phase == "flashing":
@@ -468,6 +687,8 @@ class AIDebugger:
         self.done = False
         self.step_delay_ms = step_delay_ms
         self._next_tick = 0
+        # Safe cells in the order the AI found them; entries already moved to are skipped
+        self._pending_safes = deque()
 
     def start(self):
         if self.started:
@@ -478,7 +699,7 @@ class AIDebugger:
         first = self.ms.first_safe_move
         first_cell = self.ms.cells[first[0]][first[1]]
         # Seed constraints with the first revealed clue
-        self.ai.add_constraint(first, first_cell.adjacent_mines)
+        self._add_constraint(first, first_cell.adjacent_mines)
         # Highlight the first considered cell in the UI selection
         self.ms.selector.selected_pos = first
         self.started = True
@@ -493,12 +714,14 @@ class AIDebugger:
             return False
 
         # Determine next safe move not yet explored
-        safe_moves = self.ai.safes - self.ai.moves_made
-        if safe_moves:
-            move = next(iter(safe_moves))
+        pending = self._pending_safes
+        while pending and pending[0] in self.ai.moves_made:
+            pending.popleft()
+        if pending:
+            move = pending.popleft()
             self.ai.moves_made.add(move)
             cell = self.ms.cells[move[0]][move[1]]
-            self.ai.add_constraint(move, cell.adjacent_mines)
+            self._add_constraint(move, cell.adjacent_mines)
             # Update the game selector to point at the most recently evaluated cell
             self.ms.selector.selected_pos = move
             self._next_tick = now + self.step_delay_ms
@@ -508,6 +731,26 @@ class AIDebugger:
         self.done = True
         return True
 
+    def _add_constraint(self, move, count):
+        """
+        Feeds a revealed clue to the AI, queues the newly inferred safes as
+        upcoming moves and marks every cell whose depiction changed (the move
+        itself plus all newly inferred safes and mines) as dirty on the board,
+        so the view redraws just those cells.
+
+        Args:
+            move: The (row, col) position of the revealed cell.
+            count: The number of adjacent mines to the revealed cell.
+        """
+        safes_before = self.ai.safe_mask
+        mines_before = self.ai.mine_mask
+        self.ai.add_constraint(move, count)
+        new_safes = self.ai.safe_mask & ~safes_before
+        new_mines = self.ai.mine_mask & ~mines_before
+        self._pending_safes.extend(self.ai.cells_of(new_safes))
+        self.ms.dirty_cells.add(move)
+        self.ms.dirty_cells.update(self.ai.cells_of(new_safes | new_mines))
+
 
 class GeneratorDebugger:
     """Drives repeated board generation attempts and visualizes AI reasoning until a solvable board is found."""
@@ -653,18 +896,20 @@ class GGView(View):
         """Initializes the win screen view."""
         super().__init__(context)
       
-        self.text = self.asset_manager.get_font("title").render(self.strings["mission_success"], True, config.Color.WHITE.value)
-        self.subtext = self.asset_manager.get_font("subtext").render(self.strings["trajectory_restored"], True, config.Color.WHITE.value)
-        
-        center_screen = self.context.screen.get_center()
-        self.text_rect = self.text.get_rect(center=center_screen)
-        self.subtext_rect = self.subtext.get_rect(center=(center_screen[0], center_screen[1] + 100))
+        self.text = self.asset_manager.get_text("title", self.strings["mission_success"], config.Color.WHITE.value)
+        self.subtext = self.asset_manager.get_text("subtext", self.strings["trajectory_restored"], config.Color.WHITE.value)
+        self._init_ui_elements()
+
+    def _init_ui_elements(self):
+        """Positions the texts and pre-composites the static screen (again after a resize)."""
+        self._layout_centers()
+        self.text_rect = self.text.get_rect(center=self._center)
+        self.subtext_rect = self.subtext.get_rect(center=self._subtext_center)
+        self._background = self._compose_background([(self.text, self.text_rect), (self.subtext, self.subtext_rect)])
     
     def draw(self):
         """Draws the win message."""
-        self.context.layer0.fill(config.Color.BLACK.value)
-        self.context.layer0.blit(self.text, self.text_rect)
-        self.context.layer0.blit(self.subtext, self.subtext_rect)
+        self.layer0.blit(self._background, (0, 0))
 
 # -----------------------------------------------------------------------------
 # StartView: The initial screen of the game
@@ -678,16 +923,21 @@ class StartView(View):
         super().__init__(context)
         self.next_view = None
 
-        self.text = self.asset_manager.get_font("title").render(self.strings["critical_error"], True, config.Color.RED.value)
-        self.subtext = self.asset_manager.get_font("subtext").render(self.strings["enter_prompt"], True, config.Color.WHITE.value)
-        
-        center_screen = self.context.screen.get_center()
-        self.text_rect = self.text.get_rect(center=center_screen)
-        self.subtext_rect = self.subtext.get_rect(center=(center_screen[0], center_screen[1] + 100))
+        self.text = self.asset_manager.get_text("title", self.strings["critical_error"], config.Color.RED.value)
+        self.subtext = self.asset_manager.get_text("subtext", self.strings["enter_prompt"], config.Color.WHITE.value)
+        self._init_ui_elements()
+
+    def _init_ui_elements(self):
+        """Positions the texts and pre-composites the static screen (again after a resize)."""
+        self._layout_centers()
+        self.text_rect = self.text.get_rect(center=self._center)
+        self.subtext_rect = self.subtext.get_rect(center=self._subtext_center)
+        self._background = self._compose_background([(self.text, self.text_rect), (self.subtext, self.subtext_rect)])
 
     def handle_event(self, event):
         """Transitions to the main game view when the Enter button is pressed."""
-        if event == Events.BUTTON_ENTER:
+        # Repeated presses before the switch (key repeat, button chatter) must not build more game views
+        if event == Events.BUTTON_ENTER and self.next_view is None:
             self.next_view = GameView(self.context)
     
     def update(self):
@@ -698,9 +948,7 @@ class StartView(View):
 
     def draw(self):
         """Draws the start message."""
-        self.context.layer0.fill(config.Color.BLACK.value)
-        self.context.layer0.blit(self.text, self.text_rect)
-        self.context.layer0.blit(self.subtext, self.subtext_rect)
+        self.layer0.blit(self._background, (0, 0))
 
 # -----------------------------------------------------------------------------
 # FailView: The screen shown after losing, before a reset
@@ -714,35 +962,69 @@ class FailView(View):
         """Initializes the fail screen view and its timer."""
         super().__init__(context)
         
-        self.start_ticks = pygame.time.get_ticks()
         self.timer_length = config.FAIL_VIEW_TIMER_LENGTH
         self.next_view = self
+        # Seconds left on the countdown, counted down by the timer events instead of polling the clock
+        self._remaining_seconds = self.timer_length
+        pygame.time.set_timer(config.COUNTDOWN_TIMER_EVENT, 1000, loops=self.timer_length)
+
+        # The countdown only ever shows timer_length + 1 distinct strings, so all of them
+        # are rendered up front; entry i shows timer_length - i seconds
+        self.timer_surfaces = [
+            self.asset_manager.get_text("title", f"{seconds} {self.strings['seconds']}", config.Color.WHITE.value)
+            for seconds in range(self.timer_length, -1, -1)
+        ]
+        self.subtext = self.asset_manager.get_text("subtext", self.strings["until_reset"], config.Color.WHITE.value)
+        self._init_ui_elements()
+
+    def _init_ui_elements(self):
+        """
+        Positions the texts and pre-composites the static part of the screen,
+        the subtitle, so only the countdown is drawn on top (again after a resize).
+        """
+        self._layout_centers()
+        self.timer_rects = [timer_text.get_rect(center=self._center) for timer_text in self.timer_surfaces]
+        self.subtext_rect = self.subtext.get_rect(center=self._subtext_center)
+        self._background = self._compose_background([(self.subtext, self.subtext_rect)])
+        # One prebuilt blit list per second: background, then that second's countdown
+        self._frame_blits = [
+            [(self._background, (0, 0)), (timer_text, timer_rect)]
+            for timer_text, timer_rect in zip(self.timer_surfaces, self.timer_rects)
+        ]
+        self._drawn_index = None  # Index of the frame layer0 currently shows
+
+    def handle_event(self, event):
+        """
+        Counts down one second per timer event and transitions back to the
+        game view when the countdown runs out.
+        """
+        if event == Events.COUNTDOWN_TICK and self._remaining_seconds > 0:
+            self._remaining_seconds -= 1
+            if self._remaining_seconds == 0:
+                pygame.time.set_timer(config.COUNTDOWN_TIMER_EVENT, 0)
+                self.next_view = GameView(self.context)
 
     def update(self):
         """
-        Checks the timer and transitions back to the game view when it expires.
+        Returns the next view, which handle_event sets once the countdown expires.
         """
-        elapsed_seconds = (pygame.time.get_ticks() - self.start_ticks) // 1000
-        if elapsed_seconds >= self.timer_length:
-            self.next_view = GameView(self.context)
         return self.next_view
 
     def draw(self):
-        """Draws the countdown timer."""
-        self.context.layer0.fill(config.Color.BLACK.value)
-        
-        remaining_seconds = self.timer_length - ((pygame.time.get_ticks() - self.start_ticks) // 1000)
-        timer_text_str = f"{remaining_seconds} {self.strings['seconds']}"
-        
-        timer_text = self.asset_manager.get_font("title").render(timer_text_str, True, config.Color.WHITE.value)
-        subtext = self.asset_manager.get_font("subtext").render(self.strings["until_reset"], True, config.Color.WHITE.value)
+        """
+        Draws the countdown timer. The screen only changes once per second; in
+        between, layer0 still holds the frame and nothing is drawn.
 
-        center_screen = self.context.screen.get_center()
-        timer_text_rect = timer_text.get_rect(center=center_screen)
-        subtext_rect = subtext.get_rect(center=(center_screen[0], center_screen[1] + 100))
-        
-        self.context.layer0.blit(timer_text, timer_text_rect)
-        self.context.layer0.blit(subtext, subtext_rect)
+        Returns:
+            An empty list if the frame did not change, otherwise None.
+        """
+        # Entry i shows timer_length - i seconds
+        index = self.timer_length - self._remaining_seconds
+        if index == self._drawn_index:
+            return []
+        blit_batch(self.layer0, self._frame_blits[index])
+        self._drawn_index = index
+        return None
 
 # -----------------------------------------------------------------------------
 # EmptyView: A blank screen for clean shutdown
@@ -754,10 +1036,24 @@ class EmptyView(View):
     def __init__(self, context):
         """Initializes the empty view."""
         super().__init__(context)
+        self._init_ui_elements()
+
+    def _init_ui_elements(self):
+        """Marks the screen for repainting (again after a resize, which replaces layer0)."""
+        self._painted = False
 
     def draw(self):
-        """Draws a black screen."""
-        self.context.layer0.fill(config.Color.BLACK.value)
+        """
+        Draws a black screen. It is painted once; later frames leave layer0 as it is.
+
+        Returns:
+            An empty list once the screen is painted, otherwise None.
+        """
+        if self._painted:
+            return []
+        self.layer0.fill(_BLACK)
+        self._painted = True
+        return None
 
 
 